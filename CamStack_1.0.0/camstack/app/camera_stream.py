@@ -34,6 +34,21 @@ from loguru import logger
 ANALYSIS_W = 320
 ANALYSIS_H = 240
 
+# Resolution of the grayscale frames that are actually differenced: an exact
+# 2× box-downscale of the analysis frame (4× fewer pixels to diff, and the
+# averaging suppresses sensor noise).
+MOTION_W = ANALYSIS_W // 2
+MOTION_H = ANALYSIS_H // 2
+
+# Ask OpenCV's FFmpeg backend for any available hardware decoder (V4L2 M2M,
+# VAAPI, CUDA, ...).  Builds without hardware support silently fall back to
+# software decode; very old OpenCV builds lack the property entirely.
+_HW_DECODE_PARAMS: Optional[list[int]] = (
+    [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY]
+    if hasattr(cv2, "CAP_PROP_HW_ACCELERATION")
+    else None
+)
+
 # Interval (seconds) between reconnect attempts after a capture failure.
 RECONNECT_DELAY = 5.0
 
@@ -126,11 +141,16 @@ class CameraStream:
         self._state_lock = threading.Lock()
         self._cooldown_end: float = 0.0
 
-        # K-of-N motion window
+        # K-of-N motion window, with its running sum kept alongside so the
+        # per-frame check doesn't re-sum the deque in Python.
         self._motion_window: Deque[bool] = deque(maxlen=window_size)
+        self._window_sum: int = 0
 
         # Public motion score (0.0–1.0) — updated each frame, readable from outside
         self._last_motion_score: float = 0.0
+        # Bounding box of the changed pixels in the last frame that counted as
+        # motion, as fractions of the frame (x, y, w, h); None while IDLE.
+        self._last_motion_roi: Optional[tuple[float, float, float, float]] = None
 
         # Consecutive connection-open failures (reset on success).
         self._consecutive_failures: int = 0
@@ -175,6 +195,15 @@ class CameraStream:
         """Last per-frame motion score as a fraction 0.0–1.0."""
         return self._last_motion_score
 
+    @property
+    def motion_roi(self) -> Optional[tuple[float, float, float, float]]:
+        """
+        Bounding box of the last motion-positive frame as ``(x, y, w, h)``
+        fractions of the frame; ``None`` until motion is seen and again once
+        the stream is back in IDLE.
+        """
+        return self._last_motion_roi
+
     @property
     def ring_buffer(self) -> "Deque[np.ndarray]":
         """Read-only view of the analysis frame ring buffer."""
@@ -186,8 +215,9 @@ class CameraStream:
             "state": self._state.value,
             "motion_score": round(self._last_motion_score * 100.0, 2),
             "enabled": self._enabled,
-            "k_window_sum": int(sum(self._motion_window)),
+            "k_window_sum": self._window_sum,
             "consecutive_failures": self._consecutive_failures,
+            "motion_roi": self._last_motion_roi,
         }
 
     def set_sensitivity(self, sensitivity: float) -> None:
@@ -204,10 +234,16 @@ class CameraStream:
         """Open (or reopen) the RTSP capture with TCP transport."""
         url = self.rtsp_url
         # Prefer TCP transport for reliability on Wi-Fi / NAT cameras.
-        if "rtsp_transport" not in url.lower():
-            cap = cv2.VideoCapture(url, cv2.CAP_FFMPEG)
+        api = cv2.CAP_FFMPEG if "rtsp_transport" not in url.lower() else cv2.CAP_ANY
+        if _HW_DECODE_PARAMS is not None:
+            cap = cv2.VideoCapture(url, api, _HW_DECODE_PARAMS)
         else:
-            cap = cv2.VideoCapture(url)
+            cap = cv2.VideoCapture(url, api)
+        # Keep at most one decoded frame queued so read() serves the newest.
+        # FFmpeg's nobuffer/low_delay demuxer flags are deliberately not used:
+        # OpenCV only takes them from the process-wide
+        # OPENCV_FFMPEG_CAPTURE_OPTIONS variable, which would also apply to
+        # the nature feed's HLS capture in this process.
         cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
         # Reduce ffmpeg open/read timeouts from the 30s default to 8s so that
         # a dead camera reconnect cycle takes ~10s instead of ~35s.
@@ -231,14 +267,19 @@ class CameraStream:
 
     def _score_frame(
         self, gray: np.ndarray, prev_gray: Optional[np.ndarray]
-    ) -> float:
-        """Return fraction of pixels changed (0.0–1.0) vs *prev_gray*."""
+    ) -> tuple[float, Optional[np.ndarray]]:
+        """
+        Return the fraction of pixels changed (0.0–1.0) vs *prev_gray*, and
+        the binary change mask (``None`` when there is nothing to compare).
+        """
         if prev_gray is None or gray.shape != prev_gray.shape:
-            return 0.0
+            return 0.0, None
+        # Stay inside OpenCV's vectorised uint8 kernels: no bool temporary array.
         delta = cv2.absdiff(gray, prev_gray)
-        changed = int(np.count_nonzero(delta > self.diff_threshold))
+        _, mask = cv2.threshold(delta, self.diff_threshold, 255, cv2.THRESH_BINARY)
+        changed = cv2.countNonZero(mask)
         total = gray.size
-        return changed / total if total > 0 else 0.0
+        return (changed / total if total > 0 else 0.0), mask
 
     # ------------------------------------------------------------------
     # Main loop
@@ -294,16 +335,30 @@ class CameraStream:
 
             # Only run motion analysis if enabled.
             if self._enabled:
-                gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
-                score = self._score_frame(gray, prev_gray)
+                gray = cv2.resize(
+                    cv2.cvtColor(small, cv2.COLOR_BGR2GRAY),
+                    (MOTION_W, MOTION_H),
+                    interpolation=cv2.INTER_AREA,
+                )
+                score, mask = self._score_frame(gray, prev_gray)
                 self._last_motion_score = score
                 prev_gray = gray
 
                 is_motion = score >= (self.sensitivity / 100.0)
-                self._motion_window.append(is_motion)
-                window_sum = sum(self._motion_window)
-
-                current_state = self.state
+                if is_motion and mask is not None:
+                    x, y, w, h = cv2.boundingRect(mask)
+                    gh, gw = mask.shape
+                    self._last_motion_roi = (x / gw, y / gh, w / gw, h / gh)
+                window = self._motion_window
+                if len(window) == window.maxlen and window[0]:
+                    self._window_sum -= 1
+                window.append(is_motion)
+                if is_motion:
+                    self._window_sum += 1
+                window_sum = self._window_sum
+
+                # Only this thread writes _state, so it can read it unlocked.
+                current_state = self._state
 
                 if current_state == CamStreamState.IDLE:
                     if (
@@ -330,10 +385,12 @@ class CameraStream:
                 elif current_state == CamStreamState.COOLDOWN:
                     if time.monotonic() >= self._cooldown_end:
                         self._motion_window.clear()
+                        self._window_sum = 0
+                        self._last_motion_roi = None
                         self._transition(CamStreamState.IDLE)
 
             # Throttle to the appropriate FPS.
-            current_state = self.state
+            current_state = self._state
             target_fps = (
                 self.active_fps
                 if current_state == CamStreamState.RECORDING
@@ -10,12 +10,15 @@ Public API is preserved exactly so ``player.py`` requires only minimal changes:
   - ``detector.start_monitoring()``  start all streams
   - ``detector.stop_monitoring()``   stop all streams
   - ``detector.on_confirmed``        callable set by player.py to receive motion events
+  - ``detector.wakeup_fd``           readable fd that becomes ready on each new motion event
 
 The old cold-start-ffmpeg-per-frame approach is completely replaced by persistent
 ``cv2.VideoCapture`` connections managed inside each ``CameraStream``.
 """
 from __future__ import annotations
 
+import os
+import threading
 from collections import deque
 from typing import Callable, Deque, Optional
 
@@ -82,11 +85,21 @@ class MotionDetector:
         self._cooldown_seconds = cooldown_seconds
 
         self._streams: dict[str, CameraStream] = {}
+        # Camera returned by the previous check_all_cameras() call.
+        self._last_active: Optional[str] = None
 
         # Set this callable from player.py to receive motion-confirmed events.
         # Signature: (camera_id: str, pre_frames: deque[np.ndarray]) -> None
         self.on_confirmed: Optional[Callable[[str, Deque[np.ndarray]], None]] = None
 
+        # Self-pipe written on every confirmed motion event so the player can
+        # block in select() instead of polling check_all_cameras().
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        os.set_blocking(self._wake_w, False)
+        # Serialises wake-up writes against stop_monitoring() closing the fds.
+        self._wake_lock = threading.Lock()
+
     # ------------------------------------------------------------------
     # Camera management
     # ------------------------------------------------------------------
@@ -134,6 +147,14 @@ class MotionDetector:
         """Stop all ``CameraStream`` threads (blocks until each exits or times out)."""
         for stream in self._streams.values():
             stream.stop()
+        # A capture thread that outlived stop() may still fire a wake-up;
+        # closing under the lock means that write either lands first or
+        # sees the retired fd and is skipped.
+        with self._wake_lock:
+            for fd in (self._wake_r, self._wake_w):
+                if fd >= 0:
+                    os.close(fd)
+            self._wake_r = self._wake_w = -1
         logger.info("[MotionDetector] All camera streams stopped")
 
     # ------------------------------------------------------------------
@@ -142,16 +163,35 @@ class MotionDetector:
 
     def check_all_cameras(self) -> Optional[str]:
         """
-        Return the camera_id of the first stream currently in RECORDING state,
+        Return the camera_id of a stream currently in RECORDING state,
         or ``None`` if no camera is active.
 
         This is the "is there live motion right now?" query used by the player.
+        Motion is bursty, so the camera returned last time is checked first:
+        while it keeps recording the answer costs a single lookup and the
+        player stays on it even if another camera starts recording too.
         """
+        last = self._last_active
+        if last is not None:
+            stream = self._streams.get(last)
+            if stream is not None and stream.state == CamStreamState.RECORDING:
+                return last
         for camera_id, stream in self._streams.items():
-            if stream.state == CamStreamState.RECORDING:
+            if camera_id != last and stream.state == CamStreamState.RECORDING:
+                self._last_active = camera_id
                 return camera_id
+        self._last_active = None
         return None
 
+    @property
+    def wakeup_fd(self) -> int:
+        """
+        Read end of the motion wake-up pipe (``-1`` once monitoring stopped).
+        Becomes readable when any camera confirms new motion; the reader
+        should drain it with ``os.read`` before waiting again.
+        """
+        return self._wake_r
+
     def get_camera_states(self) -> dict[str, dict]:
         """
         Return a dict camera_id → state_dict for all registered cameras.
@@ -164,6 +204,8 @@ class MotionDetector:
                 "motion_score": float,   # 0–100 percent
                 "enabled":      bool,
                 "k_window_sum": int,
+                "consecutive_failures": int,
+                "motion_roi":   (x, y, w, h) fractions | None,
             }
         """
         return {cid: stream.get_state_dict() for cid, stream in self._streams.items()}
@@ -193,6 +235,12 @@ class MotionDetector:
             f"[MotionDetector] Motion confirmed on {camera_id!r} "
             f"({len(pre_frames)} pre-event frames)"
         )
+        with self._wake_lock:
+            if self._wake_w >= 0:
+                try:
+                    os.write(self._wake_w, b"\0")
+                except OSError:
+                    pass  # pipe full: a wake-up is already pending
         if self.on_confirmed is not None:
             try:
                 self.on_confirmed(camera_id, pre_frames)
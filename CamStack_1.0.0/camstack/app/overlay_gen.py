@@ -38,6 +38,14 @@ def write_overlay(fallback: bool = False) -> Path:
         f"Dialogue: 0,0:00:00.00,9:59:59.00,HUD,,0000,0000,0000,,{{{{\\an2}}}}{tag}CamStack v{VERSION} • Device IP: {ip} • {admin}\n"
     )
 
+    # Most calls repeat the previous state; skip the rewrite (and mpv's reload
+    # of the subtitle file) when nothing changed.  Comparing against the file
+    # rather than an in-process flag stays correct when main.py writes it too.
+    try:
+        if OVERLAY.read_text(encoding="utf-8") == text:
+            return OVERLAY
+    except OSError:
+        pass
     OVERLAY.write_text(text, encoding="utf-8")
     logger.info(f"overlay written to {OVERLAY}")
     return OVERLAY
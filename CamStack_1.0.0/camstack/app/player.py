@@ -1,12 +1,12 @@
 from __future__ import annotations
 from pathlib import Path
-import subprocess, json, time, signal, threading, os
+import subprocess, json, time, signal, threading, os, sys, socket, atexit, functools, selectors
 from dataclasses import dataclass
 from typing import Optional
 from loguru import logger
 import numpy as np
 import cv2
-from PIL import Image, ImageTk
+from PIL import Image, ImageDraw, ImageFont, ImageTk
 from .overlay_gen import write_overlay, get_first_ipv4, VERSION
 from .fallback import (
     get_featured_fallback_url,
@@ -24,19 +24,36 @@ from .motion_memory import MotionMemory, DEFAULT_CLIP_DURATION
 BASE = Path("/opt/camstack")
 CFG = BASE / "runtime/config.json"
 OVL = BASE / "runtime/overlay.ass"
+MPV_IPC = BASE / "runtime/mpv.sock"   # JSON-IPC socket of the running mpv
+# Minimum level for the player's log sinks; set CAMSTACK_LOG_LEVEL=DEBUG to
+# troubleshoot.  Hot paths use logger.opt(lazy=True).debug(...) so that below
+# this level their messages are never formatted; cold paths (info/warning)
+# keep eager f-strings.
+LOG_LEVEL = os.environ.get("CAMSTACK_LOG_LEVEL", "INFO").upper()
+# mpv logs synchronously from its main thread; keep it at warnings and off the
+# SD card unless CAMSTACK_MPV_DEBUG is set.
+MPV_DEBUG = bool(os.environ.get("CAMSTACK_MPV_DEBUG"))
 
 
 def _setup_logging() -> None:
     """Register file log sinks for the player process."""
     _LOG_DIR = BASE / "logs"
     _LOG_DIR.mkdir(parents=True, exist_ok=True)
+    # Replace loguru's default DEBUG-level stderr sink so the level filter is
+    # decided once here rather than per call.
+    logger.remove()
+    logger.add(sys.stderr, level=LOG_LEVEL)
     logger.add(
         str(_LOG_DIR / "camplayer.log"),
+        level=LOG_LEVEL,
         rotation="10 MB",
         format="{time:YYYY-MM-DD HH:mm:ss.SSS} | {level:<8} | {name}:{function}:{line} - {message}",
     )
     logger.add(
         str(_LOG_DIR / "nature_feed.log"),
+        # Every tagged message is INFO; a DEBUG floor here would keep loguru
+        # formatting all lazy debug() calls even when LOG_LEVEL filters them.
+        level="INFO",
         rotation="10 MB",
         filter=lambda r: any(tag in r["message"] for tag in (
             "[NatureGrabber] Selected stream:",
@@ -49,11 +66,28 @@ def _setup_logging() -> None:
         format="{time:YYYY-MM-DD HH:mm:ss} | {message}",
     )
     logger.info("CamPlayer log sinks active")
-SNAP_DIR = BASE / "runtime/snaps"
 DEFAULT_STILL = BASE / "runtime/default.jpg"
 CAMERA_RECOVERED = 75   # sentinel: _fallback_loop returns this when cameras come back online
 
 
+def _cover_size(src_w: int, src_h: int, dst_w: int, dst_h: int) -> tuple[int, int]:
+    """Smallest size with the aspect ratio of *src* that fully covers *dst*."""
+    scale = max(dst_w / src_w, dst_h / src_h)
+    return max(1, int(round(src_w * scale))), max(1, int(round(src_h * scale)))
+
+
+def _resize_rgb(img: Image.Image, size: tuple[int, int]) -> Image.Image:
+    """
+    Resize an RGB/L PIL image with OpenCV: INTER_AREA for downscales and
+    INTER_LANCZOS4 for upscales.  Both run SIMD-vectorised and are several
+    times faster than stock Pillow's LANCZOS on the Pi.
+    """
+    w, h = size
+    shrinking = w <= img.width and h <= img.height
+    interp = cv2.INTER_AREA if shrinking else cv2.INTER_LANCZOS4
+    return Image.fromarray(cv2.resize(np.asarray(img), (w, h), interpolation=interp))
+
+
 class StillFrameDisplay:
     """Persistent fullscreen still-frame renderer for HDMI output."""
 
@@ -67,14 +101,27 @@ class StillFrameDisplay:
         screen_h = self._root.winfo_screenheight()
         self._screen_w = screen_w
         self._screen_h = screen_h
+        # Fullscreen/geometry/stacking only need re-asserting after the WM
+        # unmaps us, focus moves away, or another window is raised over ours
+        # (an overrideredirect window may never hold focus, so <FocusOut>
+        # alone misses that); the label size only changes on <Configure>.
+        self._fullscreen_ok = False
+        self._size_dirty = True
         self._enforce_fullscreen()
         self._root.config(cursor="none")
         self._root.bind("<Escape>", lambda _e: None)
+        self._root.bind("<Unmap>", self._on_lost_fullscreen, add="+")
+        self._root.bind("<FocusOut>", self._on_lost_fullscreen, add="+")
+        self._root.bind("<Visibility>", self._on_visibility, add="+")
+        self._root.bind("<Configure>", self._on_configure, add="+")
 
         self._label = tk.Label(self._root, bg="black", borderwidth=0, highlightthickness=0)
         self._label.pack(fill="both", expand=True)
 
         self._photo = None
+        # Caller's key for the frame currently on screen (see
+        # show_pil_image()); any other render clears it.
+        self._last_shown: Optional[tuple] = None
         self._width = screen_w
         self._height = screen_h
         self._alive = True
@@ -83,14 +130,30 @@ class StillFrameDisplay:
         self._enforce_fullscreen()
         self._refresh_display_size()
 
+    def _on_lost_fullscreen(self, _event=None) -> None:
+        self._fullscreen_ok = False
+
+    def _on_visibility(self, event) -> None:
+        if event.state != "VisibilityUnobscured":
+            self._fullscreen_ok = False
+
+    def _on_configure(self, _event=None) -> None:
+        self._size_dirty = True
+
     def _enforce_fullscreen(self) -> None:
+        if self._fullscreen_ok:
+            return
         self._root.overrideredirect(True)
         self._root.geometry(f"{self._screen_w}x{self._screen_h}+0+0")
         self._root.attributes("-fullscreen", True)
         self._root.attributes("-topmost", True)
         self._root.lift()
+        self._fullscreen_ok = bool(self._root.winfo_viewable())
 
     def _refresh_display_size(self) -> None:
+        if not self._size_dirty:
+            return
+        self._size_dirty = False
         label_w = self._label.winfo_width()
         label_h = self._label.winfo_height()
         root_w = self._root.winfo_width()
@@ -110,30 +173,91 @@ class StillFrameDisplay:
         try:
             self._enforce_fullscreen()
             self._refresh_display_size()
-            frame = Image.open(path).convert("RGB")
-            src_w, src_h = frame.size
-            if src_w <= 0 or src_h <= 0:
-                return False
+            frame = Image.open(path)
+            # JPEG fast path: let libjpeg decode at the largest 1/2, 1/4 or 1/8
+            # DCT scale that still covers the display (no-op for other formats).
+            frame.draft("RGB", (self._width, self._height))
+            # convert() copies even when the mode already matches; colour JPEGs
+            # come out of the drafted decoder as RGB, so only convert others.
+            if frame.mode != "RGB":
+                frame = frame.convert("RGB")
+            return self._present(frame)
+        except Exception as e:
+            logger.opt(lazy=True).debug(
+                "Still-frame render failed for {}: {}", lambda: path, lambda: e
+            )
+            return False
 
-            scale = max(self._width / src_w, self._height / src_h)
-            scaled_w = max(1, int(round(src_w * scale)))
-            scaled_h = max(1, int(round(src_h * scale)))
+    def showing(self, key: tuple) -> bool:
+        """True if the frame last shown under *key* is still on screen."""
+        return key == self._last_shown
+
+    def show_pil_image(self, frame: Image.Image, key: Optional[tuple] = None) -> bool:
+        """
+        Render an already-decoded RGB PIL image, skipping any file I/O.
+        *key* identifies the frame for a later showing() check.
+        """
+        if not self._alive:
+            return False
+        try:
+            self._enforce_fullscreen()
+            self._refresh_display_size()
+            shown = self._present(frame)
+            if shown:
+                self._last_shown = key
+            return shown
+        except Exception as e:
+            logger.opt(lazy=True).debug("show_pil_image failed: {}", lambda: e)
+            return False
 
-            resized = frame.resize((scaled_w, scaled_h), Image.Resampling.LANCZOS)
+    def _present(self, frame: Image.Image) -> bool:
+        """Cover-scale and centre-crop *frame* to the window, then display it."""
+        self._last_shown = None
+        canvas = self._fit(frame)
+        if canvas is None:
+            return False
+        self._blit(canvas)
+        self.pump()
+        return True
+
+    def _fit(self, frame: Image.Image) -> Optional[Image.Image]:
+        """Cover-scale and centre-crop *frame* to the window size."""
+        src_w, src_h = frame.size
+        if src_w <= 0 or src_h <= 0:
+            return None
 
-            left = max(0, (scaled_w - self._width) // 2)
-            top = max(0, (scaled_h - self._height) // 2)
-            right = left + self._width
-            bottom = top + self._height
+        # Already exactly window-sized (clip stills, which ffmpeg scales and
+        # crops, and live frames of the display's aspect): crop() would only
+        # make a full-frame copy, so hand the image straight to _blit.
+        if (src_w, src_h) == (self._width, self._height):
+            return frame
 
-            canvas = resized.crop((left, top, right, bottom))
-            self._photo = ImageTk.PhotoImage(canvas)
+        scaled_w, scaled_h = _cover_size(src_w, src_h, self._width, self._height)
+        # Frames pre-sized to cover the display need no resample at all.
+        if (scaled_w, scaled_h) == (src_w, src_h):
+            resized = frame
+        else:
+            resized = _resize_rgb(frame, (scaled_w, scaled_h))
+
+        left = max(0, (scaled_w - self._width) // 2)
+        top = max(0, (scaled_h - self._height) // 2)
+        right = left + self._width
+        bottom = top + self._height
+
+        return resized.crop((left, top, right, bottom))
+
+    def _blit(self, img: Image.Image) -> None:
+        """
+        Put *img* on screen.  A frame of the same size is pasted into the
+        existing PhotoImage (one pixel copy into Tk) instead of allocating a
+        new Tk image and re-configuring the label every frame.
+        """
+        photo = self._photo
+        if photo is not None and (photo.width(), photo.height()) == img.size:
+            photo.paste(img)
+        else:
+            self._photo = ImageTk.PhotoImage(img)
             self._label.configure(image=self._photo)
-            self.pump()
-            return True
-        except Exception as e:
-            logger.debug(f"Still-frame render failed for {path}: {e}")
-            return False
 
     def pump(self) -> bool:
         if not self._alive:
@@ -162,12 +286,12 @@ class StillFrameDisplay:
         if not self._alive:
             return
         try:
+            self._last_shown = None
             black = Image.new("RGB", (max(1, self._width), max(1, self._height)), (0, 0, 0))
-            self._photo = ImageTk.PhotoImage(black)
-            self._label.configure(image=self._photo)
+            self._blit(black)
             self.pump()
         except Exception as e:
-            logger.debug(f"show_black failed: {e}")
+            logger.opt(lazy=True).debug("show_black failed: {}", lambda: e)
 
     def show_np_frame(self, frame: np.ndarray) -> bool:
         """Render a BGR numpy array (from cv2) directly to the display window."""
@@ -186,58 +310,72 @@ class StillFrameDisplay:
                     (max(1, self._width), max(1, self._height)),
                     Image.Resampling.BILINEAR,
                 )
-            self._photo = ImageTk.PhotoImage(pil_img)
-            self._label.configure(image=self._photo)
+            self._last_shown = None
+            self._blit(pil_img)
             self.pump()
             return True
         except Exception as e:
-            logger.debug(f"show_np_frame failed: {e}")
+            logger.opt(lazy=True).debug("show_np_frame failed: {}", lambda: e)
             return False
 
 
-def _safe_camera_id(camera_id: str) -> str:
-    return camera_id.replace(".", "_").replace(":", "_").replace("/", "_")
+_BANNER_FONT = "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
+
+
+@functools.lru_cache(maxsize=16)
+def _get_font(size: int) -> ImageFont.ImageFont | ImageFont.FreeTypeFont:
+    """Banner font at *size*; the TTF is parsed once per size, not per frame."""
+    try:
+        return ImageFont.truetype(_BANNER_FONT, size)
+    except Exception:
+        return ImageFont.load_default()
+
+
+@functools.lru_cache(maxsize=256)
+def _text_bbox(text: str, size: int) -> tuple[int, int, int, int]:
+    """Bounding box of *text* in the banner font (same as ``textbbox`` at 0,0)."""
+    return _get_font(size).getbbox(text)
+
+
+@functools.lru_cache(maxsize=64)
+def _banner_masks(text: str, size: int, pad: int) -> tuple[Image.Image, Image.Image]:
+    """
+    Pre-rasterised banner for *text*: the pill's alpha mask and the glyph
+    mask (drawn at the text origin).  FreeType and the rounded-rectangle fill
+    run once per distinct label and size; each frame just pastes through them.
+    """
+    bbox = _text_bbox(text, size)
+    pw = bbox[2] - bbox[0] + pad * 2
+    ph = bbox[3] - bbox[1] + pad * 2
+    pill = Image.new("L", (pw + 1, ph + 1), 0)
+    ImageDraw.Draw(pill).rounded_rectangle([0, 0, pw, ph], radius=8, fill=172)
+    glyphs = Image.new("L", (max(1, bbox[2]), max(1, bbox[3])), 0)
+    ImageDraw.Draw(glyphs).text((0, 0), text, font=_get_font(size), fill=255)
+    return pill, glyphs
 
 
-def _annotate_frame(
-    src_path: Path,
-    text: str,
-    output_path: Optional[Path] = None,
-) -> Path:
+def _annotate_image(img: Image.Image, text: str) -> Image.Image:
     """
-    Render *text* as a semi-transparent banner at the bottom of a JPEG frame
-    using PIL.  Returns *output_path* on success, *src_path* on any error so
-    the caller always gets a valid image path back.
+    Draw *text* in place as a semi-transparent banner at the bottom of an RGB
+    PIL image and return it.  Pure PIL, no file I/O; on any drawing error the
+    image is returned as-is.
     """
-    from PIL import ImageDraw, ImageFont
     try:
-        dest = output_path or src_path
-        img = Image.open(src_path).convert("RGB")
-        draw = ImageDraw.Draw(img, "RGBA")
         w, h = img.size
 
         font_size = max(18, h // 22)
-        _font_path = "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
-        def _make_font(size: int):
-            try:
-                return ImageFont.truetype(_font_path, size)
-            except Exception:
-                return ImageFont.load_default()
-
-        font = _make_font(font_size)
         pad = 10
         h_margin = max(pad * 4, w // 16)   # horizontal safe zone on each side
         max_tw = w - h_margin * 2
 
         # Shrink font until the label fits within the safe horizontal width
         while font_size > 10:
-            bbox = draw.textbbox((0, 0), text, font=font)
+            bbox = _text_bbox(text, font_size)
             if (bbox[2] - bbox[0]) <= max_tw:
                 break
             font_size -= 2
-            font = _make_font(font_size)
 
-        bbox = draw.textbbox((0, 0), text, font=font)
+        bbox = _text_bbox(text, font_size)
         tw = bbox[2] - bbox[0]
         th = bbox[3] - bbox[1]
         # Keep banner well clear of the bottom edge so it isn't clipped when
@@ -248,19 +386,40 @@ def _annotate_frame(
         rx0 = (w - tw) // 2 - pad
         ry1 = h - bottom_margin
         ry0 = ry1 - th - pad * 2
-        rx1 = rx0 + tw + pad * 2
-        draw.rounded_rectangle([rx0, ry0, rx1, ry1], radius=8, fill=(0, 0, 0, 172))
-        draw.text(
-            ((w - tw) // 2, ry0 + pad // 2),
-            text,
-            font=font,
-            fill=(255, 220, 50, 255),   # warm amber
-        )
-        img.save(str(dest), "JPEG", quality=85)
-        return dest
+        pill, glyphs = _banner_masks(text, font_size, pad)
+        img.paste((0, 0, 0), (rx0, ry0), pill)
+        img.paste((255, 220, 50), ((w - tw) // 2, ry0 + pad // 2), glyphs)  # warm amber
     except Exception as e:
-        logger.debug(f"Frame annotation failed: {e}")
-        return src_path
+        logger.opt(lazy=True).debug("Frame annotation failed: {}", lambda: e)
+    return img
+
+
+def _read_frame(stream, buf: np.ndarray) -> bool:
+    """Fill *buf* in place from a raw-video pipe; False on EOF / short frame."""
+    view = memoryview(buf).cast("B")
+    got = 0
+    while got < len(view):
+        n = stream.readinto(view[got:])
+        if not n:
+            return False
+        got += n
+    return True
+
+
+def _prefetch_file(path: Path) -> None:
+    """Ask the kernel to start reading *path* into the page cache (best effort)."""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
 
 
 def _play_clip_as_stills(
@@ -272,62 +431,72 @@ def _play_clip_as_stills(
     abort_check=None,
 ) -> None:
     """
-    Decode a recorded mp4 clip to JPEG frames and render via StillFrameDisplay.
+    Decode a recorded mp4 clip and render it frame by frame via StillFrameDisplay.
+    ffmpeg streams raw RGB frames, already scaled and cropped to the display,
+    through a pipe into one preallocated buffer: no temp JPEGs, no per-frame
+    encode/decode, and playback starts before the whole clip is decoded.
     No mpv spawned. No window teardown. Desktop never exposed.
     abort_check is an optional callable() -> bool; return True to stop early.
     speed > 1.0 accelerates playback (e.g. 2.0 = double speed).
     """
-    import tempfile, shutil
-    tmp = Path(tempfile.mkdtemp(prefix="camclip_"))
+    _prefetch_file(clip_path)
+    w, h = max(1, display._width), max(1, display._height)
+    cmd = [
+        "ffmpeg", "-hide_banner", "-loglevel", "error",
+        "-hwaccel", "auto", "-i", str(clip_path),
+        "-vf", f"fps={fps},scale={w}:{h}:force_original_aspect_ratio=increase,crop={w}:{h}",
+        "-f", "rawvideo", "-pix_fmt", "rgb24", "-",
+    ]
+    buf = np.empty((h, w, 3), dtype=np.uint8)
+    proc: Optional[subprocess.Popen] = None
     try:
-        result = subprocess.run(
-            [
-                "ffmpeg", "-hide_banner", "-loglevel", "error",
-                "-i", str(clip_path),
-                "-r", str(fps),
-                str(tmp / "f%05d.jpg"),
-            ],
-            timeout=30,
-            capture_output=True,
+        # -loglevel error keeps stderr to a few lines, well inside the pipe
+        # buffer, so it is safe to leave unread until stdout hits EOF.
+        proc = subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, bufsize=0
         )
-        if result.returncode != 0:
-            logger.warning(f"[ClipStills] ffmpeg decode failed for {clip_path.name}")
-            return
-        frames = sorted(tmp.glob("f*.jpg"))
-        if not frames:
-            logger.warning(f"[ClipStills] No frames decoded from {clip_path.name}")
-            return
         effective_speed = max(0.25, float(speed))
         frame_interval = 1.0 / (fps * effective_speed)
-        for frame in frames:
+        shown = 0
+        aborted = False
+        # Pace against absolute deadlines so read/annotate/blit time is taken
+        # out of the wait instead of stretching every frame by it.
+        next_due = time.monotonic()
+        while _read_frame(proc.stdout, buf):
             if abort_check and abort_check():
                 logger.debug("[ClipStills] Aborted early — live motion detected")
+                aborted = True
                 break
-            out = _annotate_frame(frame, annotation) if annotation else frame
-            display.show_image(out)
-            time.sleep(frame_interval)
+            # fromarray copies buf, so the next read can refill it while this
+            # frame (and any banner drawn on it) is still being shown.
+            frame = Image.fromarray(buf)
+            if annotation:
+                frame = _annotate_image(frame, annotation)
+            display.show_pil_image(frame)
+            shown += 1
+            next_due += frame_interval
+            delay = next_due - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_due = time.monotonic()  # fell behind: don't try to catch up
+        if not aborted:
+            err = proc.stderr.read().decode(errors="replace").strip()
+            rc = proc.wait(timeout=5)
+            if rc != 0:
+                logger.warning(
+                    f"[ClipStills] ffmpeg decode failed for {clip_path.name} (rc={rc}): {err}"
+                )
+        if shown == 0:
+            logger.warning(f"[ClipStills] No frames decoded from {clip_path.name}")
     except Exception as e:
         logger.warning(f"[ClipStills] Error playing {clip_path.name}: {e}")
     finally:
-        shutil.rmtree(tmp, ignore_errors=True)
-
-
-def _grab_display_frame(rtsp_url: str, camera_id: str) -> Optional[Path]:
-    """Capture one display-quality still frame from RTSP stream."""
-    SNAP_DIR.mkdir(parents=True, exist_ok=True)
-    snap_path = SNAP_DIR / f"display_{_safe_camera_id(camera_id)}.jpg"
-    cmd = [
-        "ffmpeg", "-hide_banner", "-loglevel", "error",
-        "-rtsp_transport", "tcp", "-i", rtsp_url,
-        "-frames:v", "1", "-q:v", "4", "-y", str(snap_path),
-    ]
-    try:
-        subprocess.run(cmd, check=True, timeout=4, capture_output=True)
-        if snap_path.exists() and snap_path.stat().st_size > 0:
-            return snap_path
-    except Exception as e:
-        logger.debug(f"Display frame capture failed for {camera_id}: {e}")
-    return None
+        if proc is not None:
+            if proc.poll() is None:
+                _terminate_proc(proc, timeout=2)
+            proc.stdout.close()
+            proc.stderr.close()
 
 
 def _show_default_still(display: StillFrameDisplay) -> bool:
@@ -461,7 +630,7 @@ class NatureGrabber:
                 # Load per-stream blocklist from config.
                 _blocked: set[str] = set()
                 try:
-                    _blocked = set(json.loads(CFG.read_text()).get("blocked_streams", []))
+                    _blocked = set(_load_cfg().get("blocked_streams", []))
                 except Exception:
                     pass
                 # Shuffle the candidate pool and try each until one passes
@@ -561,23 +730,26 @@ class NatureGrabber:
 
 def run_player_once(url: str) -> int:
     write_overlay(False)
-    procs, primary, files = _spawn_player(url)
-    logger.info(f"Launching mpv: {url}")
-    rc = primary.wait()
-    _terminate_procs(procs)
-    _close_files(files)
-    return rc
+    with PlayerSession(url) as session:
+        logger.info(f"Launching mpv: {url}")
+        return session.primary.wait()
 
 def _build_mpv_cmd(url: str, use_ytdl: bool = True) -> list[str]:
     cmd = [
-        "mpv", "--hwdec=auto", "--fs", "--force-window=yes", "--osc=no",
+        "mpv", "--hwdec=auto-safe", "--fs", "--force-window=yes", "--osc=no",
         "--no-input-default-bindings", f"-sub-file={OVL}", "--sid=1",
-        "--no-border", "-msg-level=all=info,ffmpeg=info",
-        "--log-file=/opt/camstack/runtime/mpv-debug.log",
+        "--no-border", f"--input-ipc-server={MPV_IPC}",
         "--network-timeout=15", "--rtsp-transport=tcp",
         "--demuxer-max-bytes=64MiB", "--cache-secs=30",
         "--demuxer-readahead-secs=10",
     ]
+    if MPV_DEBUG:
+        cmd.extend([
+            "-msg-level=all=info,ffmpeg=info",
+            "--log-file=/opt/camstack/runtime/mpv-debug.log",
+        ])
+    else:
+        cmd.append("-msg-level=all=warn")
     if use_ytdl:
         cmd.extend(
             [
@@ -597,6 +769,25 @@ def _build_mpv_cmd(url: str, use_ytdl: bool = True) -> list[str]:
     cmd.append(url)
     return cmd
 
+def _mpv_send(command: list[str], timeout: float = 2.0) -> bool:
+    """
+    Send one JSON-IPC *command* to the running mpv and wait for its reply.
+    Returns True only when mpv acknowledges it with ``"error": "success"``.
+    """
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(str(MPV_IPC))
+            sock.sendall(json.dumps({"command": command}).encode() + b"\n")
+            # mpv may interleave async events before the command reply.
+            for line in sock.makefile("rb"):
+                msg = json.loads(line)
+                if "error" in msg:
+                    return msg["error"] == "success"
+    except (OSError, ValueError) as e:
+        logger.debug(f"[Player] mpv IPC {command[0]!r} failed: {e}")
+    return False
+
 def _is_youtube_url(url: str) -> bool:
     return "youtube.com" in url or "youtu.be" in url
 
@@ -644,6 +835,127 @@ def _close_files(files: list[object]) -> None:
         except Exception:
             pass
 
+
+class PlayerSession:
+    """
+    Owns the processes and log handles returned by ``_spawn_player``.
+
+    ``close()`` always terminates the processes *and* closes the handles, so
+    an exception between the two can no longer leak a file descriptor.  Use
+    as a context manager; sessions still open at interpreter exit are closed
+    by the ``atexit`` hook.
+    """
+
+    _open: set["PlayerSession"] = set()
+
+    def __init__(self, url: str) -> None:
+        self.url = url
+        self.procs: list[subprocess.Popen] = []
+        self.primary: Optional[subprocess.Popen] = None
+        self.files: list = []
+
+    def __enter__(self) -> "PlayerSession":
+        return self.start()
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+    def start(self) -> "PlayerSession":
+        self.procs, self.primary, self.files = _spawn_player(self.url)
+        PlayerSession._open.add(self)
+        return self
+
+    def poll(self) -> Optional[int]:
+        """Exit code of the primary process, or None while it is running."""
+        if self.primary is None:
+            return -1   # a failed (re)spawn counts as an exited player
+        return self.primary.poll()
+
+    def restart(self, url: str) -> None:
+        """Tear down the current player and spawn a fresh one for *url*."""
+        self.close()
+        self.url = url
+        self.start()
+
+    def switch(self, url: str) -> None:
+        """
+        Point the running mpv at *url* with ``loadfile … replace`` over JSON
+        IPC, keeping the process and its window; respawn only when mpv has
+        exited or is not answering.
+        """
+        if self.poll() is None and _mpv_send(["loadfile", url, "replace"]):
+            self.url = url
+            return
+        self.restart(url)
+
+    def close(self) -> None:
+        try:
+            _terminate_procs(self.procs)
+        finally:
+            _close_files(self.files)
+            self.procs, self.primary, self.files = [], None, []
+            PlayerSession._open.discard(self)
+
+    @classmethod
+    def cleanup_all(cls) -> None:
+        for session in list(cls._open):
+            session.close()
+
+
+atexit.register(PlayerSession.cleanup_all)
+
+
+class _EventWaiter:
+    """
+    Blocks the main loop until the detector signals new motion (its wake-up
+    pipe), the watched mpv process exits (pidfd), or a timeout elapses,
+    instead of waking on a fixed sleep just to poll.
+    """
+
+    def __init__(self, wakeup_fd: int) -> None:
+        self._sel = selectors.DefaultSelector()
+        self._wakeup_fd = wakeup_fd
+        self._sel.register(wakeup_fd, selectors.EVENT_READ)
+        self._pid: Optional[int] = None
+        self._pidfd: Optional[int] = None
+
+    def watch(self, proc: Optional[subprocess.Popen]) -> None:
+        """Track *proc* for exit; re-registers only when the process changes."""
+        pid = proc.pid if proc is not None else None
+        if pid == self._pid:
+            return
+        self._unwatch()
+        self._pid = pid
+        if pid is None:
+            return
+        try:
+            self._pidfd = os.pidfd_open(pid)
+        except (AttributeError, OSError):
+            return  # Linux < 5.3: the timeout still bounds crash detection
+        self._sel.register(self._pidfd, selectors.EVENT_READ)
+
+    def wait(self, timeout: float) -> bool:
+        """Wait up to *timeout* seconds; True when woken by new motion."""
+        motion = False
+        for key, _ in self._sel.select(max(0.0, timeout)):
+            if key.fd == self._wakeup_fd:
+                motion = True
+                try:
+                    os.read(self._wakeup_fd, 4096)
+                except OSError:
+                    pass
+        return motion
+
+    def _unwatch(self) -> None:
+        if self._pidfd is not None:
+            self._sel.unregister(self._pidfd)
+            os.close(self._pidfd)
+            self._pidfd = None
+
+    def close(self) -> None:
+        self._unwatch()
+        self._sel.close()
+
 def _probe_any_rtsp(camera_urls: list[str], timeout: int = 5) -> bool:
     """Return True if at least one RTSP URL responds with a valid video frame."""
     for url in camera_urls:
@@ -692,68 +1004,63 @@ def _fallback_loop(recover_urls: list[str] | None = None) -> int:
         + (f" title={current.title!r}" if current.title else "")
         + f" (viewers={current.viewers})"
     )
-    procs, primary, files = _spawn_player(current.url)
-    stream_start = time.monotonic()
+    with PlayerSession(current.url) as session:
+        stream_start = time.monotonic()
 
-    while True:
-        try:
-            if primary.poll() is not None:
-                duration = int(time.monotonic() - stream_start)
-                record_play(current.url, title=current.title or "", duration=duration)
-                blocked.add(current.url)
-                logger.warning(
-                    f"[Fallback] Stream ended/crashed: {current.url}"
-                    + (f" ({current.title!r})" if current.title else "")
-                    + " — selecting a new candidate"
-                )
-                time.sleep(3)  # brief backoff to prevent rapid crash loops
-                try:
-                    best = get_best_live_stream(exclude=blocked)
-                except Exception as e:
-                    logger.warning(f"Ranking failed: {e}")
-                    best = None
-                if best is None:
-                    # Filter blocked URLs from the random pool to avoid re-selecting
-                    # a stream that just crashed.
-                    fallback_url = get_featured_fallback_url(exclude=blocked)
-                    current = LiveStreamInfo(url=fallback_url, title=None, viewers=0)
-                else:
-                    current = best
-                    save_cached_stream(best)
-                logger.info(
-                    f"[Fallback] Next stream: {current.url}"
-                    + (f" ({current.title!r})" if current.title else "")
-                )
-                write_overlay(True)
-                _terminate_procs(procs)
-                _close_files(files)
-                procs, primary, files = _spawn_player(current.url)
-                stream_start = time.monotonic()
+        while True:
+            try:
+                if session.poll() is not None:
+                    duration = int(time.monotonic() - stream_start)
+                    record_play(current.url, title=current.title or "", duration=duration)
+                    blocked.add(current.url)
+                    logger.warning(
+                        f"[Fallback] Stream ended/crashed: {current.url}"
+                        + (f" ({current.title!r})" if current.title else "")
+                        + " — selecting a new candidate"
+                    )
+                    time.sleep(3)  # brief backoff to prevent rapid crash loops
+                    try:
+                        best = get_best_live_stream(exclude=blocked)
+                    except Exception as e:
+                        logger.warning(f"Ranking failed: {e}")
+                        best = None
+                    if best is None:
+                        # Filter blocked URLs from the random pool to avoid re-selecting
+                        # a stream that just crashed.
+                        fallback_url = get_featured_fallback_url(exclude=blocked)
+                        current = LiveStreamInfo(url=fallback_url, title=None, viewers=0)
+                    else:
+                        current = best
+                        save_cached_stream(best)
+                    logger.info(
+                        f"[Fallback] Next stream: {current.url}"
+                        + (f" ({current.title!r})" if current.title else "")
+                    )
+                    write_overlay(True)
+                    session.restart(current.url)
+                    stream_start = time.monotonic()
+                    continue
+            except Exception as e:
+                logger.warning(f"Fallback loop error: {e}")
+                time.sleep(2)
                 continue
-        except Exception as e:
-            logger.warning(f"Fallback loop error: {e}")
-            time.sleep(2)
-            continue
-
-        # Camera recovery probe: periodically test if live streams are reachable.
-        now = time.monotonic()
-        if recover_urls and (now - last_recovery_check) >= _RECOVERY_INTERVAL:
-            last_recovery_check = now
-            if _probe_any_rtsp(recover_urls):
-                logger.info("[Fallback] Camera(s) back online — returning to live mode")
-                _terminate_procs(procs)
-                _close_files(files)
-                return CAMERA_RECOVERED
-
-        time.sleep(1)
+
+            # Camera recovery probe: periodically test if live streams are reachable.
+            now = time.monotonic()
+            if recover_urls and (now - last_recovery_check) >= _RECOVERY_INTERVAL:
+                last_recovery_check = now
+                if _probe_any_rtsp(recover_urls):
+                    logger.info("[Fallback] Camera(s) back online — returning to live mode")
+                    return CAMERA_RECOVERED
+
+            time.sleep(1)
 
 def launch_rtsp_then_fallback() -> int:
     url = None
-    if CFG.exists():
-        try:
-            url = json.loads(CFG.read_text()).get("rtsp_url")
-        except Exception:
-            pass
+    try:
+        url = _load_cfg().get("rtsp_url")
+    except Exception:
+        pass
     if url:
         rc = run_player_once(url)
         if rc == 0:
@@ -763,6 +1070,28 @@ def launch_rtsp_then_fallback() -> int:
     logger.warning("RTSP missing or failed; switching to fallback nature cam")
     return run_player_once(fb)
 
+_notify_sock: Optional[socket.socket] = None
+
+
+def _sd_notify(state: bytes) -> bool:
+    """
+    Send a notification such as ``b"WATCHDOG=1"`` straight to systemd's
+    ``$NOTIFY_SOCKET``, reusing one datagram socket for the process lifetime
+    instead of forking ``systemd-notify``.  Returns False when not running
+    under systemd; raises OSError if the send fails.
+    """
+    global _notify_sock
+    addr = os.environ.get("NOTIFY_SOCKET")
+    if not addr:
+        return False
+    if addr.startswith("@"):
+        addr = "\0" + addr[1:]   # abstract-namespace socket
+    if _notify_sock is None:
+        _notify_sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    _notify_sock.sendto(state, addr)
+    return True
+
+
 def launch_rtsp_with_watchdog() -> int:
     """Launch player with systemd watchdog support and health monitoring."""
     import os, time, signal, threading
@@ -783,11 +1112,10 @@ def launch_rtsp_with_watchdog() -> int:
             while True:
                 try:
                     # Send watchdog keep-alive to systemd
-                    subprocess.run(["systemd-notify", "WATCHDOG=1"], 
-                                 check=False, capture_output=True)
+                    _sd_notify(b"WATCHDOG=1")
                     time.sleep(watchdog_interval)
                 except Exception as e:
-                    logger.debug(f"Watchdog notification failed: {e}")
+                    logger.opt(lazy=True).debug("Watchdog notification failed: {}", lambda: e)
                     time.sleep(10)
         
         # Start watchdog thread
@@ -795,7 +1123,10 @@ def launch_rtsp_with_watchdog() -> int:
         wd_thread.start()
     
     # Notify systemd we're ready
-    subprocess.run(["systemd-notify", "--ready"], check=False, capture_output=True)
+    try:
+        _sd_notify(b"READY=1")
+    except OSError as e:
+        logger.debug(f"Ready notification failed: {e}")
     
     # Launch multi-camera ambient display whenever cameras are configured.
     # motion_detection.enabled only controls recording behaviour, not the display.
@@ -813,11 +1144,10 @@ def launch_rtsp_with_watchdog() -> int:
     # Standard single-camera mode
     # Launch player with watchdog monitoring
     url = None
-    if CFG.exists():
-        try:
-            url = json.loads(CFG.read_text()).get("rtsp_url")
-        except Exception:
-            pass
+    try:
+        url = _load_cfg().get("rtsp_url")
+    except Exception:
+        pass
     
     if url:
         logger.info(f"Attempting RTSP stream: {url}")
@@ -833,48 +1163,39 @@ def launch_rtsp_with_watchdog() -> int:
     return rc
 
 
+_cfg_cache: tuple[int, dict] = (-1, {})
+
+
+def _load_cfg() -> dict:
+    """
+    Parsed config.json, re-parsed only when its mtime changes ({} if missing).
+    The dict is shared between callers: treat it as read-only.
+    Raises on invalid JSON, like the ``json.loads`` calls it replaces.
+    """
+    global _cfg_cache
+    try:
+        mtime_ns = CFG.stat().st_mtime_ns
+    except FileNotFoundError:
+        return {}
+    if mtime_ns != _cfg_cache[0]:
+        # bytes go straight to the C decoder without a str round-trip.
+        _cfg_cache = (mtime_ns, json.loads(CFG.read_bytes()))
+    return _cfg_cache[1]
+
+
 def _load_motion_config() -> Optional[dict]:
     """Load motion detection configuration from config.json."""
-    if not CFG.exists():
-        return None
     try:
-        cfg = json.loads(CFG.read_text())
-        return cfg.get("motion_detection")
+        return _load_cfg().get("motion_detection")
     except Exception as e:
         logger.warning(f"Failed to load motion config: {e}")
         return None
 
 
-def _start_frame_grabbers(
-    cameras: list[tuple[str, str]],
-    interval: float,
-    stop_event: threading.Event,
-    cache: dict,
-) -> list[threading.Thread]:
-    """
-    Start one background ffmpeg frame-grab thread per camera.
-    Each thread writes ``(path, grab_timestamp)`` into *cache[camera_id]*.
-    Non-blocking: main loop reads from the cache without waiting on ffmpeg.
-    """
-    def _grabber(camera_id: str, rtsp_url: str) -> None:
-        while not stop_event.is_set():
-            path = _grab_display_frame(rtsp_url, camera_id)
-            if path is not None:
-                cache[camera_id] = (path, time.monotonic())
-            stop_event.wait(interval)  # interruptible sleep
-
-    threads = []
-    for camera_id, rtsp_url in cameras:
-        t = threading.Thread(
-            target=_grabber,
-            args=(camera_id, rtsp_url),
-            daemon=True,
-            name=f"grabber-{_safe_camera_id(camera_id)}",
-        )
-        t.start()
-        threads.append(t)
-        logger.debug(f"[Grabber] Started background frame grabber for {camera_id}")
-    return threads
+# Reused full-screen composite buffers, one per (height, width).  The caller
+# copies each composite into Tk before the next one is drawn, so at 30 fps this
+# saves a full-screen allocation per frame.
+_canvas_cache: dict[tuple[int, int], np.ndarray] = {}
 
 
 def _compose_ambient_frame(
@@ -892,8 +1213,13 @@ def _compose_ambient_frame(
       - Nature feed rendered as a PIP window in the bottom-right corner
         (1/4 screen width, 16:9 aspect ratio).
       - If no cameras are available, nature fills the entire screen.
+
+    The returned array is a shared buffer, overwritten by the next call.
     """
-    base = np.zeros((screen_h, screen_w, 3), dtype=np.uint8)
+    base = _canvas_cache.get((screen_h, screen_w))
+    if base is None:
+        base = np.zeros((screen_h, screen_w, 3), dtype=np.uint8)
+        _canvas_cache[(screen_h, screen_w)] = base
 
     if camera_frames:
         # ── Camera grid: fill the entire screen ──
@@ -902,6 +1228,8 @@ def _compose_ambient_frame(
         rows = max(1, (n + cols - 1) // cols)
         tile_w = screen_w // cols
         tile_h = screen_h // rows
+        if n < rows * cols:
+            base.fill(0)  # empty grid cells stay black
 
         for idx, (cam_id, cam_frame) in enumerate(camera_frames):
             row = idx // cols
@@ -913,7 +1241,9 @@ def _compose_ambient_frame(
             tw, th = x1 - x0, y1 - y0
             if tw <= 0 or th <= 0:
                 continue
-            tile = cv2.resize(cam_frame, (tw, th))
+            # Resize and draw straight into the tile's region of the canvas.
+            tile = base[y0:y1, x0:x1]
+            cv2.resize(cam_frame, (tw, th), dst=tile)
             cv2.rectangle(tile, (0, 0), (tw - 1, th - 1), (50, 50, 50), 1)
             label = cam_id if len(cam_id) <= 18 else cam_id[-18:]
             font_scale = max(0.3, th / 240.0)
@@ -922,7 +1252,6 @@ def _compose_ambient_frame(
                 cv2.FONT_HERSHEY_SIMPLEX, font_scale,
                 (220, 220, 220), 1, cv2.LINE_AA,
             )
-            base[y0:y1, x0:x1] = tile
 
         # ── Nature PIP: bottom-right corner, 1/4 screen width, 16:9 ──
         if nature_frame is not None:
@@ -930,14 +1259,16 @@ def _compose_ambient_frame(
             pip_h = (pip_w * 9) // 16
             pip_x = screen_w - pip_w - 8
             pip_y = screen_h - pip_h - 8
-            pip = cv2.resize(nature_frame, (pip_w, pip_h))
+            pip = base[pip_y:pip_y + pip_h, pip_x:pip_x + pip_w]
+            cv2.resize(nature_frame, (pip_w, pip_h), dst=pip)
             cv2.rectangle(pip, (0, 0), (pip_w - 1, pip_h - 1), (200, 200, 200), 2)
-            base[pip_y:pip_y + pip_h, pip_x:pip_x + pip_w] = pip
 
     else:
         # ── No cameras: nature fills the entire screen ──
         if nature_frame is not None:
-            base = cv2.resize(nature_frame, (screen_w, screen_h))
+            cv2.resize(nature_frame, (screen_w, screen_h), dst=base)
+        else:
+            base.fill(0)
 
     # CamStack server IP label — top-left corner
     if server_label:
@@ -947,14 +1278,11 @@ def _compose_ambient_frame(
             server_label, cv2.FONT_HERSHEY_SIMPLEX, lbl_scale, lbl_thickness
         )
         pad = 6
-        # Semi-transparent dark backing rectangle
+        # Semi-transparent dark backing rectangle: blending with black is
+        # just scaling the region down to 45% in place.
         overlay_roi = base[pad : pad + lbl_h + baseline + pad * 2,
                            pad : pad + lbl_w + pad * 2]
-        dark = overlay_roi.copy()
-        cv2.rectangle(dark, (0, 0), (dark.shape[1] - 1, dark.shape[0] - 1), (0, 0, 0), -1)
-        cv2.addWeighted(dark, 0.55, overlay_roi, 0.45, 0, overlay_roi)
-        base[pad : pad + lbl_h + baseline + pad * 2,
-             pad : pad + lbl_w + pad * 2] = overlay_roi
+        cv2.addWeighted(overlay_roi, 0.45, overlay_roi, 0.0, 0, dst=overlay_roi)
         cv2.putText(
             base, server_label,
             (pad * 2, pad + lbl_h + pad // 2),
@@ -1030,6 +1358,10 @@ def launch_with_motion_detection(motion_config: dict) -> int:
     )
     # Lookup dict for fast url resolution during on_confirmed callback
     _camera_url_map: dict[str, str] = {cam_id: url for cam_id, url in enabled_cameras}
+    # ...and for the rotation index when motion switches cameras.
+    _camera_idx_map: dict[str, int] = {
+        cam_id: i for i, (cam_id, _) in enumerate(enabled_cameras)
+    }
 
     # State tracking
     current_camera_idx = 0
@@ -1039,17 +1371,32 @@ def launch_with_motion_detection(motion_config: dict) -> int:
     motion_mode = False
     display_interval = max(0.15, min(1.0, snapshot_interval))
     last_display_update = 0.0
+    # Outside motion mode a camera whose own motion score (percent of changed
+    # pixels) stays below this is treated as a static scene: its last converted
+    # frame is reused, but never for longer than _STATIC_REFRESH seconds.
+    _STATIC_SCORE = 0.2
+    _STATIC_REFRESH = 10.0
+    frame_converted_at: dict[str, float] = {}
     # Ambient nature feed renders independently at ~30fps, decoupled from the
     # camera snapshot_interval which only needs to be as fast as ffmpeg grabs.
     _ambient_interval = 1.0 / 30.0
     last_ambient_update = 0.0
-    last_frame_path: Optional[Path] = None
-    last_successful_frame_at = time.monotonic()
+    last_frame: Optional[Image.Image] = None   # last good un-annotated frame
+    last_frame_seq = -1
+    frame_seq = 0  # bumped per converted camera frame; keys the annotation
+    # Motion state only changes at camera frame rate (and usually far slower),
+    # so the detector is polled at half the snapshot interval, not every tick.
+    motion_check_interval = snapshot_interval * 0.5
+    last_motion_check = 0.0
+    motion_camera_id: Optional[str] = None
+    camera_states: dict[str, dict] = {}
     startup_time = time.monotonic()
+    last_successful_frame_at = startup_time
     # Allow this many seconds for RTSP connections and NatureGrabber to produce
     # their first frames before any offline checks are permitted to fire.
     _STARTUP_GRACE = 20.0
-    frame_fail_counts: dict[str, int] = {cam_id: 0 for cam_id, _ in enabled_cameras}
+    # Consecutive missing-frame counts, indexed like enabled_cameras.
+    frame_fail_counts = np.zeros(len(enabled_cameras), dtype=np.int32)
     all_offline_fail_threshold = 3
     offline_frame_timeout = max(12.0, (rotation_interval * len(enabled_cameras)) + 3.0)
 
@@ -1071,14 +1418,33 @@ def launch_with_motion_detection(motion_config: dict) -> int:
         nature_grabber.start()
         logger.info("[AmbientMode] Nature grabber started \u2014 nature feed active in idle mode")
 
-    # Per-camera snapshot path cache for the still-frame renderer.
+    # Per-camera decoded-frame cache for the still-frame renderer.
     # Populated inline in the display loop from CameraStream's latest frame (no
     # separate ffmpeg grabber threads — CameraStream handles persistent RTSP).
-    # Entries: None | (Path, grab_timestamp: float)
-    _frame_cache: dict[str, tuple[Path, float] | None] = {
+    # Frames stay in memory as PIL images; nothing is JPEG-encoded to disk.
+    # Entries: None | (Image, grab_timestamp: float, source BGR array, seq: int)
+    _frame_cache: dict[str, tuple[Image.Image, float, np.ndarray, int] | None] = {
         cam_id: None for cam_id, _ in enabled_cameras
     }
 
+    # Banner text per camera, rebuilt at most once a second (the finest unit
+    # of format_motion_age): time_since_motion() takes a lock and stats the
+    # clip file, which is wasted work on every display tick.
+    _banner_cache: dict[str, tuple[float, str]] = {}
+
+    def _camera_banner(camera_id: str, now: float) -> str:
+        hit = _banner_cache.get(camera_id)
+        if hit is not None and (now - hit[0]) < 1.0:
+            return hit[1]
+        parts = [camera_id]
+        ago = motion_memory.time_since_motion(camera_id)
+        if ago:
+            parts.append(f"Last motion: {ago}")
+        parts.append(_server_label)
+        text = "  \u2022  ".join(parts)
+        _banner_cache[camera_id] = (now, text)
+        return text
+
     # Wire the on_confirmed callback only when motion recording is enabled.
     # The ambient display runs regardless; this flag only gates clip recording.
     motion_recording_enabled: bool = motion_config.get("enabled", False)
@@ -1100,16 +1466,14 @@ def launch_with_motion_detection(motion_config: dict) -> int:
     # Start all CameraStream threads (persistent RTSP + K-of-N state machines).
     detector.start_monitoring()
 
-    # Safe defaults so the finally block never hits UnboundLocalError.
-    # Only reassigned when display is None (legacy mpv path).
-    procs: list = []
-    primary = None
-    files: list = []
+    # Only set when display is None (legacy mpv path); closed in finally.
+    session: Optional[PlayerSession] = None
+    waiter = _EventWaiter(detector.wakeup_fd)
 
     # Fallback path: if tkinter unavailable use mpv per-camera (legacy mode).
     if display is None:
         write_overlay(False)
-        procs, primary, files = _spawn_player(current_rtsp_url)
+        session = PlayerSession(current_rtsp_url).start()
         logger.info(f"Displaying camera {current_camera_id}: {current_rtsp_url}")
     else:
         logger.info(f"Displaying camera {current_camera_id} using still-frame renderer")
@@ -1123,32 +1487,34 @@ def launch_with_motion_detection(motion_config: dict) -> int:
                 logger.warning("Still-frame GUI closed, switching to mpv fallback")
                 display = None
                 write_overlay(False)
-                procs, primary, files = _spawn_player(current_rtsp_url)
+                session = PlayerSession(current_rtsp_url).start()
 
             # Check for player crash in fallback mode.
-            if display is None and primary.poll() is not None:
+            if display is None and session.poll() is not None:
                 logger.warning(f"Player crashed for camera {current_camera_id}, advancing...")
-                _terminate_procs(procs)
-                _close_files(files)
 
                 current_camera_idx = (current_camera_idx + 1) % len(enabled_cameras)
                 current_camera_id, current_rtsp_url = enabled_cameras[current_camera_idx]
                 last_rotation = now
 
                 write_overlay(False)
-                procs, primary, files = _spawn_player(current_rtsp_url)
+                session.restart(current_rtsp_url)
                 logger.info(f"Switched to camera {current_camera_id}")
                 time.sleep(2)
                 continue
             
             # Check for motion (returns camera_id if any stream is in RECORDING state)
-            motion_camera_id = detector.check_all_cameras()
+            # Per-camera state dicts are rebuilt on the same cadence and reused
+            # by the offline checks below.
+            if (now - last_motion_check) >= motion_check_interval:
+                motion_camera_id = detector.check_all_cameras()
+                camera_states = detector.get_camera_states()
+                last_motion_check = now
             # Note: clip recording is handled by detector.on_confirmed callback which
             # fires once per event with the pre-event ring buffer for context.
 
             # If all monitored cameras have failed/been disabled, stop showing
             # stale camera imagery and switch to nature fallback behavior.
-            camera_states = detector.get_camera_states()
             startup_done = (now - startup_time) >= _STARTUP_GRACE
             # A camera is considered offline when it has been unreachable for
             # _OFFLINE_FAILURE_THRESHOLD consecutive attempts (matching the
@@ -1166,8 +1532,8 @@ def launch_with_motion_detection(motion_config: dict) -> int:
             all_snapshots_failing = (
                 startup_done
                 and nature_grabber is None
-                and bool(frame_fail_counts)
-                and all(count >= all_offline_fail_threshold for count in frame_fail_counts.values())
+                and frame_fail_counts.size > 0
+                and bool(np.all(frame_fail_counts >= all_offline_fail_threshold))
             )
             # Frame-timeout check also skipped in ambient mode — nature stream
             # keeps the display alive even when cameras are temporarily offline.
@@ -1179,42 +1545,36 @@ def launch_with_motion_detection(motion_config: dict) -> int:
 
             if all_cameras_offline or all_snapshots_failing or frame_timeout_exceeded:
                 logger.warning("All motion cameras appear offline; switching to fallback stream")
+                waiter.close()
                 detector.stop_monitoring()
                 if display is not None:
                     display.show_black()  # black frame so desktop never flashes
                     display.close()
                     display = None
                 else:
-                    _terminate_procs(procs)
-                    _close_files(files)
+                    session.close()
                 camera_urls = [url for _, url in enabled_cameras]
                 return _fallback_loop(recover_urls=camera_urls)
 
             if motion_camera_id and motion_camera_id != current_camera_id:
                 # Motion detected on different camera - switch immediately
                 logger.info(f"Motion detected on camera {motion_camera_id}, switching...")
-                if display is None:
-                    _terminate_procs(procs)
-                    _close_files(files)
-                
+
                 # Find the camera
-                motion_rtsp_url = None
-                for i, (cam_id, rtsp_url) in enumerate(enabled_cameras):
-                    if cam_id == motion_camera_id:
-                        motion_rtsp_url = rtsp_url
-                        current_camera_idx = i
-                        break
-                
-                if motion_rtsp_url:
-                    current_camera_id = motion_camera_id
-                    current_rtsp_url = motion_rtsp_url
+                motion_idx = _camera_idx_map.get(motion_camera_id)
+
+                if motion_idx is not None:
+                    current_camera_idx = motion_idx
+                    current_camera_id, current_rtsp_url = enabled_cameras[motion_idx]
                     last_motion_camera = motion_camera_id
                     motion_mode = True
                     last_rotation = now
 
+                    # Swap the input of the running mpv in place; a full
+                    # respawn (RTSP handshake + decoder init) is only the
+                    # fallback when the IPC socket is not answering.
                     if display is None:
-                        write_overlay(False)
-                        procs, primary, files = _spawn_player(current_rtsp_url)
+                        session.switch(current_rtsp_url)
                     logger.info(f"Now displaying motion camera: {current_camera_id}")
                 
             elif motion_camera_id == current_camera_id:
@@ -1232,18 +1592,13 @@ def launch_with_motion_detection(motion_config: dict) -> int:
             # Rotation logic (only when no motion AND ambient mode is off)
             if not motion_mode and nature_grabber is None and (now - last_rotation) >= rotation_interval:
                 # Time to rotate to next camera
-                if display is None:
-                    _terminate_procs(procs)
-                    _close_files(files)
-
                 current_camera_idx = (current_camera_idx + 1) % len(enabled_cameras)
                 current_camera_id, current_rtsp_url = enabled_cameras[current_camera_idx]
                 last_rotation = now
-                last_frame_path = None  # invalidate stale cache for new camera
+                last_frame = None  # invalidate stale cache for new camera
 
                 if display is None:
-                    write_overlay(False)
-                    procs, primary, files = _spawn_player(current_rtsp_url)
+                    session.switch(current_rtsp_url)
                 logger.info(f"Rotated to camera {current_camera_id}")
 
                 # --- Motion Memory: show last clip as rapid still frames ---
@@ -1268,6 +1623,7 @@ def launch_with_motion_detection(motion_config: dict) -> int:
                         )
                         # Re-read motion state after clip (abort_check may have fired)
                         motion_camera_id = detector.check_all_cameras()
+                        last_motion_check = time.monotonic()
 
             # Render still frames when GUI mode is available.
             # Ambient nature feed uses its own fast interval; single-camera mode
@@ -1277,13 +1633,13 @@ def launch_with_motion_detection(motion_config: dict) -> int:
                     # ── Ambient mode: nature background + all camera tiles in Q4 ──
                     n_frame = nature_grabber.latest_frame
                     cam_tiles: list[tuple[str, np.ndarray]] = []
-                    for cam_id, _ in enabled_cameras:
+                    for i, (cam_id, _) in enumerate(enabled_cameras):
                         f = detector.get_display_frame(cam_id)
                         if f is not None:
                             cam_tiles.append((cam_id, f))
-                            frame_fail_counts[cam_id] = 0
+                            frame_fail_counts[i] = 0
                         else:
-                            frame_fail_counts[cam_id] = frame_fail_counts.get(cam_id, 0) + 1
+                            frame_fail_counts[i] += 1
                     if n_frame is not None or cam_tiles:
                         last_successful_frame_at = now
                     composite = _compose_ambient_frame(
@@ -1295,61 +1651,97 @@ def launch_with_motion_detection(motion_config: dict) -> int:
             elif display is not None and (now - last_display_update) >= display_interval:
                 # ── Single-camera mode (motion detected or ambient disabled) ──
                 bgr_frame = detector.get_display_frame(current_camera_id)
-                if bgr_frame is not None:
-                    snap_path = SNAP_DIR / f"live_{_safe_camera_id(current_camera_id)}.jpg"
-                    rgb = bgr_frame[:, :, ::-1]
-                    Image.fromarray(rgb).save(str(snap_path), "JPEG", quality=85)
-                    _frame_cache[current_camera_id] = (snap_path, now)
                 cached = _frame_cache.get(current_camera_id)
+                if bgr_frame is not None:
+                    cam_state = camera_states.get(current_camera_id)
+                    if cached is not None and cached[2] is bgr_frame:
+                        # Capture thread has no newer frame yet: reuse the conversion.
+                        cached = (cached[0], now, bgr_frame, cached[3])
+                    elif (
+                        cached is not None
+                        and not motion_mode
+                        and cam_state is not None
+                        and cam_state.get("enabled")
+                        and cam_state.get("motion_score", 100.0) < _STATIC_SCORE
+                        and (now - frame_converted_at.get(current_camera_id, 0.0)) < _STATIC_REFRESH
+                    ):
+                        # Static scene: the new frame would look the same.
+                        cached = (cached[0], now, cached[2], cached[3])
+                    else:
+                        # Shrink to just cover the display so annotation draws on
+                        # fewer pixels and show_pil_image skips its resize.
+                        fh, fw = bgr_frame.shape[:2]
+                        cover = _cover_size(fw, fh, display._width, display._height)
+                        small = bgr_frame
+                        if cover[0] < fw:
+                            small = cv2.resize(bgr_frame, cover, interpolation=cv2.INTER_AREA)
+                        rgb = cv2.cvtColor(small, cv2.COLOR_BGR2RGB)
+                        frame_seq += 1
+                        cached = (Image.fromarray(rgb), now, bgr_frame, frame_seq)
+                        frame_converted_at[current_camera_id] = now
+                    _frame_cache[current_camera_id] = cached
                 max_stale = display_interval * 4 + 2.0
                 frame_fresh = (
                     cached is not None
                     and (now - cached[1]) < max_stale
                 )
                 if frame_fresh:
-                    frame_path, _ = cached
-                    frame_fail_counts[current_camera_id] = 0
+                    frame, _, _, seq = cached
+                    frame_fail_counts[current_camera_idx] = 0
                     last_successful_frame_at = now
-                    ago = motion_memory.time_since_motion(current_camera_id)
-                    ann_parts = [current_camera_id]
-                    if ago:
-                        ann_parts.append(f"Last motion: {ago}")
-                    ann_parts.append(_server_label)
-                    ann_path = SNAP_DIR / f"annotated_{_safe_camera_id(current_camera_id)}.jpg"
-                    frame_path = _annotate_frame(frame_path, "  \u2022  ".join(ann_parts), ann_path)
-                    if display.show_image(frame_path):
-                        last_frame_path = frame_path
+                    ann_text = _camera_banner(current_camera_id, now)
+                    # Same frame and same banner as on screen: nothing to redraw.
+                    ann_key = (seq, ann_text, display._width, display._height)
+                    if display.showing(ann_key):
+                        last_frame, last_frame_seq = frame, seq
+                    else:
+                        # Annotate a copy so the cached frame stays banner-free.
+                        annotated = _annotate_image(frame.copy(), ann_text)
+                        if display.show_pil_image(annotated, key=ann_key):
+                            last_frame, last_frame_seq = frame, seq
                 else:
-                    frame_fail_counts[current_camera_id] = (
-                        frame_fail_counts.get(current_camera_id, 0) + 1
-                    )
-                    if last_frame_path is not None:
-                        ago = motion_memory.time_since_motion(current_camera_id)
-                        stale_parts = [current_camera_id]
-                        if ago:
-                            stale_parts.append(f"Last motion: {ago}")
-                        stale_parts.append(_server_label)
-                        ann_path = SNAP_DIR / f"annotated_{_safe_camera_id(current_camera_id)}.jpg"
-                        show_path = _annotate_frame(
-                            last_frame_path, "  \u2022  ".join(stale_parts), ann_path
-                        )
-                        display.show_image(show_path)
+                    frame_fail_counts[current_camera_idx] += 1
+                    if last_frame is not None:
+                        stale_text = _camera_banner(current_camera_id, now)
+                        ann_key = (last_frame_seq, stale_text, display._width, display._height)
+                        if not display.showing(ann_key):
+                            annotated = _annotate_image(last_frame.copy(), stale_text)
+                            display.show_pil_image(annotated, key=ann_key)
                 last_display_update = now
 
-            time.sleep(0.016)  # ~60Hz tick — fine-grained timing for 30fps ambient renders
+            if display is not None:
+                # Sleep until the next render or motion poll is due, waking
+                # at once on new motion; Tk is still pumped at least every 50 ms.
+                if nature_grabber is not None and not motion_mode:
+                    next_due = last_ambient_update + _ambient_interval
+                else:
+                    next_due = last_display_update + display_interval
+                    if not motion_mode and nature_grabber is None:
+                        next_due = min(next_due, last_rotation + rotation_interval)
+                next_due = min(next_due, last_motion_check + motion_check_interval)
+                timeout = min(0.05, next_due - time.monotonic())
+            else:
+                # mpv mode has no GUI to pump: sleep until the player exits,
+                # new motion arrives, or the next rotation is due.
+                timeout = 1.0
+                if not motion_mode and nature_grabber is None:
+                    timeout = min(timeout, rotation_interval - (now - last_rotation))
+                waiter.watch(session.primary)
+            if waiter.wait(timeout):
+                last_motion_check = float("-inf")  # poll the detector right away
             
     except KeyboardInterrupt:
         logger.info("Motion detection interrupted by user")
     except Exception as e:
         logger.exception(f"Motion detection error: {e}")
     finally:
+        waiter.close()
         detector.stop_monitoring()    # stops all CameraStream threads
         if nature_grabber is not None:
             nature_grabber.stop()
         if display is not None:
             display.close()
-        elif procs:
-            _terminate_procs(procs)
-            _close_files(files)
+        elif session is not None:
+            session.close()
 
     return 0
@@ -1,13 +1,43 @@
-from starlette.applications import Starlette
-from starlette.responses import RedirectResponse
-from starlette.requests import Request
-from starlette.routing import Route
-
-async def do_redirect(request: Request):
-    host = request.headers.get("host", "").split(":")[0]
-    path = request.url.path or "/"
-    query = ("?" + request.url.query) if request.url.query else ""
-    return RedirectResponse(url=f"https://{host}{path}{query}", status_code=308)
-
-routes = [Route("/{path:path}", do_redirect)]
-app = Starlette(routes=routes)
+"""
+Port-80 HTTP → HTTPS redirector, served by uvicorn as ``app.redirect_http:app``.
+
+Every request gets a bodiless 308 to the same host/path/query over https.
+Written as a bare ASGI callable: no routing, Request or Response objects are
+needed just to echo the URL back.
+"""
+import functools
+
+
+@functools.lru_cache(maxsize=64)
+def _prefix(host_header: bytes) -> bytes:
+    """``b"https://<host>"`` for a raw Host header, port stripped."""
+    return b"https://" + host_header.split(b":", 1)[0]
+
+
+async def app(scope, receive, send):
+    if scope["type"] == "lifespan":
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+    if scope["type"] != "http":
+        return
+
+    host = b""
+    for name, value in scope["headers"]:
+        if name == b"host":
+            host = value
+            break
+    path = scope.get("raw_path") or scope["path"].encode() or b"/"
+    query = scope.get("query_string", b"")
+    location = _prefix(host) + path + (b"?" + query if query else b"")
+
+    await send({
+        "type": "http.response.start",
+        "status": 308,
+        "headers": [(b"location", location), (b"content-length", b"0")],
+    })
+    await send({"type": "http.response.body", "body": b""})